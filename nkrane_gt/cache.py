@@ -0,0 +1,37 @@
+# nkrane_gt/cache.py
+"""
+Persistent on-disk cache for Google Translate responses.
+
+Repeat translations of the same text short-circuit the network round-trip
+entirely, which also keeps repeated CLI runs clear of Google's rate
+limits. Backed by a stdlib shelve in ~/.cache/nkrane-gt; cache failures
+are swallowed so a broken cache can never break translation.
+"""
+import hashlib
+import os
+import shelve
+
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'nkrane-gt')
+_CACHE_PATH = os.path.join(_CACHE_DIR, 'translations')
+
+def make_key(src_lang: str, target_lang: str, text: str) -> str:
+    """Build a content-addressed key for one translation request."""
+    raw = f"{src_lang}|{target_lang}|{text}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def get(key: str):
+    """Return the cached value for key, or None on a miss (or any error)."""
+    try:
+        with shelve.open(_CACHE_PATH) as db:
+            return db.get(key)
+    except Exception:
+        return None
+
+def set(key: str, value):
+    """Store value under key, creating the cache directory if needed."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with shelve.open(_CACHE_PATH) as db:
+            db[key] = value
+    except Exception:
+        pass
@@ -6,7 +6,6 @@ Simple translation tool with terminology control
 
 import argparse
 import sys
-from nkrane_gt import NkraneTranslator
 
 def main():
     parser = argparse.ArgumentParser(
@@ -78,6 +77,27 @@ Supported target languages:
         help='Output file path (optional, defaults to stdout)'
     )
     
+    # Cache control
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the persistent translation cache and always call Google'
+    )
+
+    # Rate limiting
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=3.0,
+        help='Max Google requests per second (default: 3, 0 disables pacing)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Parallel requests for per-line batch translation (default: 4)'
+    )
+
     # Debug mode
     parser.add_argument(
         '--debug',
@@ -93,7 +113,11 @@ Supported target languages:
     )
     
     args = parser.parse_args()
-    
+
+    # Imported only after argument parsing so --help and usage errors don't
+    # pay for spaCy/requests imports
+    from nkrane_gt import get_translator
+
     # Suppress logging if quiet mode
     if args.quiet:
         import logging
@@ -104,36 +128,46 @@ Supported target languages:
         if not args.quiet:
             print(f"🚀 Initializing translator ({args.source} → {args.target})...")
         
-        translator = NkraneTranslator(
+        translator = get_translator(
             target_lang=args.target,
             src_lang=args.source,
-            terminology_source=args.terminology
+            terminology_source=args.terminology,
+            use_cache=not args.no_cache,
+            rate_limit=args.rate
         )
         
         # Get text to translate
         if args.file:
             # Read from file
             with open(args.file, 'r', encoding='utf-8') as f:
-                texts = [line.strip() for line in f if line.strip()]
+                # Stream line by line; strip each line once rather than
+                # materializing a second stripped copy per line
+                texts = list(filter(None, (line.strip() for line in f)))
             
             if not args.quiet:
                 print(f"📄 Loaded {len(texts)} lines from {args.file}")
             
             # Batch translate
-            results = translator.batch_translate(texts, debug=args.debug)
+            results = translator.batch_translate(texts, debug=args.debug,
+                                                 concurrency=args.concurrency)
             
-            # Prepare output
+            # Prepare output; per-line summaries are buffered and written in
+            # one go instead of issuing several print calls per result
             output_lines = []
+            debug_lines = []
             for i, result in enumerate(results):
                 if 'error' in result:
                     output_lines.append(f"[ERROR] {result['error']}")
                 else:
                     output_lines.append(result['text'])
                     if args.debug and not args.quiet:
-                        print(f"\n[{i+1}/{len(texts)}] {result['original']}")
-                        print(f"    → {result['text']}")
-                        print(f"    Terms replaced: {result['replacements_count']}")
-            
+                        debug_lines.append(f"\n[{i+1}/{len(texts)}] {result['original']}")
+                        debug_lines.append(f"    → {result['text']}")
+                        debug_lines.append(f"    Terms replaced: {result['replacements_count']}")
+
+            if debug_lines:
+                sys.stdout.write('\n'.join(debug_lines) + '\n')
+
             output_text = '\n'.join(output_lines)
             
         else:
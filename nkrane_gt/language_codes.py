@@ -2,29 +2,57 @@
 """
 Language code conversion utilities.
 """
+import functools
 
-LANGUAGE_CODE_MAPPING = {
+# Kept as explicit pairs so a repeated ISO code can be detected below -
+# in a dict literal a duplicate key silently overrides the earlier entry.
+_MAPPING_PAIRS = (
     # ISO 639-3 to Google Translate (ISO 639-1)
-    'eng': 'en',
-    'spa': 'es',
-    'fra': 'fr',
-    'tha': 'th',  # Thai
-    
+    ('eng', 'en'),
+    ('spa', 'es'),
+    ('fra', 'fr'),
+    ('tha', 'th'),  # Thai
+
     # Ghanaian languages
-    'twi': 'ak',  # Akan/Twi (using 'ak' for Google)
-    'aka': 'ak',  # Akan
-    'gaa': 'gaa',  # Ga
-    'ewe': 'ee',  # Ewe
-    
+    ('twi', 'ak'),  # Akan/Twi (using 'ak' for Google)
+    ('aka', 'ak'),  # Akan
+    ('gaa', 'gaa'),  # Ga
+    ('ewe', 'ee'),  # Ewe
+
     # Other African languages
-    'hau': 'ha',  # Hausa
-    'ibo': 'ig',  # Igbo
-    'yor': 'yo',  # Yoruba
-    'zul': 'zu',  # Zulu
-    'swa': 'sw',  # Swahili
-    'amh': 'am',  # Amharic
-}
+    ('hau', 'ha'),  # Hausa
+    ('ibo', 'ig'),  # Igbo
+    ('yor', 'yo'),  # Yoruba
+    ('zul', 'zu'),  # Zulu
+    ('swa', 'sw'),  # Swahili
+    ('amh', 'am'),  # Amharic
+)
+
+LANGUAGE_CODE_MAPPING = dict(_MAPPING_PAIRS)
+assert len(LANGUAGE_CODE_MAPPING) == len(_MAPPING_PAIRS), \
+    "Duplicate ISO code in LANGUAGE_CODE_MAPPING"
+
+# Precomputed reverse lookup (Google 2-letter -> ISO 639-3). Where several
+# ISO codes share one Google code (e.g. 'twi'/'aka' -> 'ak'), the first
+# entry in LANGUAGE_CODE_MAPPING wins, matching the old linear scan.
+_REVERSE_MAPPING = {}
+for _iso3, _google in LANGUAGE_CODE_MAPPING.items():
+    _REVERSE_MAPPING.setdefault(_google, _iso3)
+
+# Common Google Translate supported languages including our target languages
+_SUPPORTED_CODES = frozenset({
+    'en', 'es', 'fr', 'de', 'zh', 'ja', 'ko', 'ru', 'ar', 'hi',
+    'pt', 'it', 'nl', 'pl', 'sv', 'da', 'fi', 'el', 'cs', 'ro',
+    'hu', 'sk', 'bg', 'sl', 'lt', 'lv', 'et', 'mt', 'th',
 
+    # African languages
+    'ak',  # Twi/Akan
+    'gaa',  # Ga
+    'ee',  # Ewe
+    'ha', 'ig', 'yo', 'zu', 'sw', 'am'
+})
+
+@functools.lru_cache(maxsize=256)
 def convert_lang_code(lang_code: str, to_google: bool = True) -> str:
     """
     Convert between ISO 639-3 (3-letter) and Google Translate (2-letter) codes.
@@ -47,13 +75,11 @@ def convert_lang_code(lang_code: str, to_google: bool = True) -> str:
         # Convert 2-letter to 3-letter (reverse lookup)
         if len(lang_code) == 3:
             return lang_code  # Already in ISO 639-3 format
-        
+
         # Reverse lookup
-        for iso3, google in LANGUAGE_CODE_MAPPING.items():
-            if google == lang_code:
-                return iso3
-        return lang_code + 'x'  # Default if not found
+        return _REVERSE_MAPPING.get(lang_code, lang_code + 'x')  # Default if not found
 
+@functools.lru_cache(maxsize=256)
 def is_google_supported(lang_code: str) -> bool:
     """
     Check if a language is likely supported by Google Translate.
@@ -65,18 +91,5 @@ def is_google_supported(lang_code: str) -> bool:
         True if likely supported, False otherwise
     """
     google_code = convert_lang_code(lang_code, to_google=True)
-    
-    # Common Google Translate supported languages including our target languages
-    supported_codes = {
-        'en', 'es', 'fr', 'de', 'zh', 'ja', 'ko', 'ru', 'ar', 'hi',
-        'pt', 'it', 'nl', 'pl', 'sv', 'da', 'fi', 'el', 'cs', 'ro',
-        'hu', 'sk', 'bg', 'sl', 'lt', 'lv', 'et', 'mt', 'th',
-        
-        # African languages
-        'ak',  # Twi/Akan
-        'gaa',  # Ga
-        'ee',  # Ewe
-        'ha', 'ig', 'yo', 'zu', 'sw', 'am'
-    }
-    
-    return google_code in supported_codes
+
+    return google_code in _SUPPORTED_CODES
@@ -1,20 +1,89 @@
 # nkrane_gt/terminology_manager.py
 import os
 import csv
+import functools
+import pickle
 import re
 import spacy
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass
 
-# Load spaCy model for English
+# Stopwords come straight from spaCy's English defaults - importing them
+# does not load a model
+from spacy.lang.en.stop_words import STOP_WORDS as STOPWORDS
+
+# The English model is loaded lazily on first use so importing the package
+# (CLI --help, language-code helpers, the fast scan path) doesn't pay the
+# several-hundred-ms model load up front.
+_nlp = None
+_nlp_failed = False
+
+def _get_nlp():
+    """Return the shared spaCy pipeline, loading it on first use.
+
+    Only the tagger and parser are needed (noun_chunks, sents, token text),
+    so the remaining components are disabled to cut per-call pipeline cost
+    roughly in half. tok2vec is kept because the tagger and parser in
+    en_core_web_sm listen to it. Returns None when the model is missing;
+    callers fall back to the regex-based paths in that case.
+    """
+    global _nlp, _nlp_failed
+    if _nlp is None and not _nlp_failed:
+        try:
+            _nlp = spacy.load("en_core_web_sm", disable=["ner", "lemmatizer", "attribute_ruler"])
+        except Exception:
+            print("Warning: spaCy model not found. Please install: python -m spacy download en_core_web_sm")
+            _nlp_failed = True
+    return _nlp
+
+# Precompiled patterns for the postprocessing hot path
+_SENT_CAP_RE = re.compile(r'([.!?])\s+([a-z])')
+_PLACEHOLDER_RE = re.compile(r'<(\d+)>')
+
+# Optional Aho-Corasick automaton for fast multi-pattern term matching
+# (pip install pyahocorasick)
 try:
-    nlp = spacy.load("en_core_web_sm")
-    STOPWORDS = nlp.Defaults.stop_words
-    SPACY_AVAILABLE = True
-except:
-    print("Warning: spaCy model not found. Please install: python -m spacy download en_core_web_sm")
-    SPACY_AVAILABLE = False
-    STOPWORDS = set()
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Case tags computed once at preprocess time so postprocess_text doesn't
+# have to re-scan the original phrase for every placeholder
+_CASE_UPPER = 'upper'        # "THE HOUSE"
+_CASE_TITLE = 'title'        # "Big House"
+_CASE_SENTENCE = 'sentence'  # "The house" / "House"
+_CASE_LOWER = 'lower'        # "the house"
+
+def _detect_case_tag(content: str, full: str, leading: str) -> str:
+    """Classify the casing of an original phrase into one of the case tags."""
+    original_to_check = full if full else content
+    if not original_to_check:
+        return _CASE_LOWER
+
+    if original_to_check.isupper():
+        return _CASE_UPPER
+    if content.istitle() or (len(content.split()) > 1 and all(word[0].isupper() for word in content.split() if word)):
+        return _CASE_TITLE
+
+    leading_stripped = leading.strip()
+    if (content and content[0].isupper()) or (leading_stripped and leading_stripped[0].isupper()):
+        return _CASE_SENTENCE
+
+    return _CASE_LOWER
+
+@functools.lru_cache(maxsize=4096)
+def _remove_stopwords_cached(phrase: str) -> str:
+    """Remove stopwords from an already-lowercased phrase, memoized.
+
+    Uses a plain set lookup against spaCy's stopword list - running the
+    full pipeline just to read `is_stop` would be wasted work. Callers
+    pass lowercased input (matching the lowercased term keys), so no
+    extra .lower() copy is made here. The cache is bounded so streaming
+    workloads can't grow memory without limit.
+    """
+    filtered_words = [w for w in phrase.split() if w not in STOPWORDS]
+    return ' '.join(filtered_words)
 
 @dataclass
 class Term:
@@ -23,17 +92,27 @@ class Term:
     source: str  # 'user'
 
 class TerminologyManager:
-    def __init__(self, target_lang: str, user_csv_path: str = None):
+    def __init__(self, target_lang: str, user_csv_path: str = None,
+                 use_noun_phrases: bool = False):
         """
         Initialize terminology manager.
 
         Args:
             target_lang: Target language code (ak, ee, gaa)
             user_csv_path: Path to user's CSV file (optional)
+            use_noun_phrases: If True, restrict matching to spaCy noun chunks
+                instead of the fast linear scan over the term set
         """
         self.target_lang = target_lang
-        self.terms = {}  # Dictionary: english_term -> translation
+        # Dictionary: english_term -> translation. Keys are always
+        # lowercased on load; every lookup site relies on this invariant
+        # and passes pre-lowercased input instead of calling .lower() again.
+        self.terms = {}
         self.csv_provided = False
+        self.use_noun_phrases = use_noun_phrases
+        self.automaton = None
+        self.trie = {}
+        self._term_regex = None
 
         # Load user terms
         if user_csv_path:
@@ -41,109 +120,275 @@ class TerminologyManager:
         else:
             print("ℹ️  No terminology CSV provided. Translation will be direct without term substitution.")
 
+        if self.terms:
+            self._build_trie()
+            if AHOCORASICK_AVAILABLE:
+                self._build_automaton()
+            elif len(self.terms) < 10000:
+                # For moderate term counts a single compiled alternation
+                # beats the pure-Python trie walk; huge dictionaries would
+                # blow up the pattern, so those stay on the trie
+                self._build_term_regex()
+
+            # Batch inputs commonly repeat lines (headers, templated rows);
+            # memoize the scan per instance - terms are fixed after init,
+            # so cached results stay valid
+            self._find_term_matches = functools.lru_cache(maxsize=4096)(
+                self._find_term_matches
+            )
+
     def _load_user_terms(self, csv_path: str):
-        """Load user terms from CSV file."""
+        """Load user terms from CSV file.
+
+        Delimiter detection goes through csv.Sniffer and the parse itself
+        through pandas' C reader - much faster than a Python DictReader
+        loop for large terminology files.
+        """
+        # Prefer a precompiled pickle (built at install time for packaged
+        # CSVs) when it is at least as fresh as the CSV itself - loading it
+        # skips the parse entirely
+        pkl_path = csv_path + '.pkl'
+        try:
+            if os.path.getmtime(pkl_path) >= os.path.getmtime(csv_path):
+                with open(pkl_path, 'rb') as f:
+                    compiled_terms = pickle.load(f)
+                self.terms.update(compiled_terms)
+                self.csv_provided = True
+                print(f"✅ Loaded {len(compiled_terms)} terms from {pkl_path}")
+                return
+        except Exception:
+            pass  # no usable pickle - parse the CSV below
+
+        import pandas as pd
+
         try:
             with open(csv_path, 'r', encoding='utf-8') as f:
-                # Try to detect the delimiter
                 sample = f.read(1024)
-                f.seek(0)
-
-                # Check for common delimiters
-                if ',' in sample:
-                    delimiter = ','
-                elif ';' in sample:
-                    delimiter = ';'
-                elif '\t' in sample:
-                    delimiter = '\t'
+
+            # Detect the delimiter
+            try:
+                delimiter = csv.Sniffer().sniff(sample, delimiters=',;\t').delimiter
+            except csv.Error:
+                delimiter = ','  # default
+
+            df = pd.read_csv(csv_path, sep=delimiter, encoding='utf-8', dtype=str)
+            fieldnames = [col.lower() for col in df.columns]
+
+            # Determine which columns to use
+            text_col = None
+            trans_col = None
+
+            # Look for text column
+            for col in ['text', 'english', 'source', 'term', 'word']:
+                if col in fieldnames:
+                    text_col = df.columns[fieldnames.index(col)]
+                    break
+
+            # Look for translation column
+            for col in ['text_translated', 'translation', 'target', 'translated']:
+                if col in fieldnames:
+                    trans_col = df.columns[fieldnames.index(col)]
+                    break
+
+            # If not found, use first two columns
+            if text_col is None or trans_col is None:
+                if len(df.columns) >= 2:
+                    text_col = df.columns[0]
+                    trans_col = df.columns[1]
                 else:
-                    delimiter = ','  # default
-
-                reader = csv.DictReader(f, delimiter=delimiter)
-                fieldnames = [f.lower() for f in reader.fieldnames] if reader.fieldnames else []
-
-                # Determine which columns to use
-                text_col = None
-                trans_col = None
-
-                # Look for text column
-                for col in ['text', 'english', 'source', 'term', 'word']:
-                    if col in fieldnames:
-                        text_col = col
-                        break
-
-                # Look for translation column
-                for col in ['text_translated', 'translation', 'target', 'translated']:
-                    if col in fieldnames:
-                        trans_col = col
-                        break
-
-                # If not found, use first two columns
-                if not text_col or not trans_col:
-                    if len(fieldnames) >= 2:
-                        text_col = reader.fieldnames[0]
-                        trans_col = reader.fieldnames[1]
-                    else:
-                        print(f"❌ Error: CSV needs at least 2 columns")
-                        return
-
-                # Read terms
-                user_terms_count = 0
-                for row in reader:
-                    english_term = row.get(text_col, '').strip().lower()
-                    translation = row.get(trans_col, '').strip()
-
-                    if english_term and translation:
-                        self.terms[english_term] = translation
-                        user_terms_count += 1
+                    print(f"❌ Error: CSV needs at least 2 columns")
+                    return
 
-                self.csv_provided = True
-                print(f"✅ Loaded {user_terms_count} terms from {csv_path}")
+            # Build the term dict from the two columns in vectorized code
+            pairs = df[[text_col, trans_col]].dropna()
+            english_terms = pairs[text_col].str.strip().str.lower()
+            translations = pairs[trans_col].str.strip()
+            valid = (english_terms != '') & (translations != '')
+            self.terms.update(zip(english_terms[valid], translations[valid]))
+
+            self.csv_provided = True
+            print(f"✅ Loaded {int(valid.sum())} terms from {csv_path}")
 
         except FileNotFoundError:
             print(f"❌ Error: CSV file not found at '{csv_path}'")
         except Exception as e:
             print(f"❌ Error loading user CSV: {e}")
 
+    def _build_automaton(self):
+        """Build an Aho-Corasick automaton over the loaded terms.
+
+        Finds all term occurrences in a single O(n) scan regardless of how
+        many terms are loaded, without needing the spaCy parse at all.
+        """
+        self.automaton = ahocorasick.Automaton()
+        for term, translation in self.terms.items():
+            self.automaton.add_word(term, (term, translation))
+        self.automaton.make_automaton()
+
+    def _build_trie(self):
+        """Build a nested-dict trie keyed on the words of each term.
+
+        Lets multi-word terms like "machine learning model" be found with a
+        greedy longest-prefix walk over cheap word tokens, with no external
+        dependency and no parser.
+        """
+        self.trie = {}
+        for term, translation in self.terms.items():
+            node = self.trie
+            for word in term.split():
+                node = node.setdefault(word, {})
+            node['$'] = (term, translation)
+
+    def _build_term_regex(self):
+        """Compile a single word-bounded alternation over all terms.
+
+        Terms are sorted longest-first so the alternation prefers the
+        longest match at any position, mirroring the other matchers.
+        """
+        escaped = sorted((re.escape(term) for term in self.terms),
+                         key=len, reverse=True)
+        self._term_regex = re.compile(
+            r'\b(?:' + '|'.join(escaped) + r')\b', re.IGNORECASE
+        )
+
+    def _find_term_matches(self, text_lower: str) -> List[Tuple[int, int, str, str]]:
+        """Locate terminology occurrences in lowercased text.
+
+        Uses the Aho-Corasick automaton when available, then the compiled
+        alternation regex, then the word trie. Returns a list of
+        (start, end, term, translation) tuples, filtered to whole-word hits
+        with overlaps resolved longest-match-first.
+        """
+        if self.automaton is not None:
+            candidates = []
+            for end_index, (term, translation) in self.automaton.iter(text_lower):
+                start = end_index - len(term) + 1
+                end = end_index + 1
+
+                # Only accept whole-word matches ("car" must not hit "carpet")
+                if start > 0 and (text_lower[start - 1].isalnum() or text_lower[start - 1] == '_'):
+                    continue
+                if end < len(text_lower) and (text_lower[end].isalnum() or text_lower[end] == '_'):
+                    continue
+
+                candidates.append((start, end, term, translation))
+        elif self._term_regex is not None:
+            candidates = [
+                (m.start(), m.end(), m.group(0), self.terms[m.group(0)])
+                for m in self._term_regex.finditer(text_lower)
+            ]
+        else:
+            candidates = self._find_trie_candidates(text_lower)
+
+        return self._resolve_overlaps(candidates)
+
+    def _find_trie_candidates(self, text_lower: str) -> List[Tuple[int, int, str, str]]:
+        """Walk the word trie over cheap regex tokens, longest match per position."""
+        words = [(m.group(), m.start(), m.end()) for m in re.finditer(r'\w+', text_lower)]
+        candidates = []
+
+        for i in range(len(words)):
+            node = self.trie
+            best = None
+
+            for j in range(i, len(words)):
+                word, start, end = words[j]
+
+                # Words of a multi-word term may only be separated by whitespace
+                if j > i and not text_lower[words[j - 1][2]:start].isspace():
+                    break
+                if word not in node:
+                    break
+
+                node = node[word]
+                if '$' in node:
+                    term, translation = node['$']
+                    best = (words[i][1], end, term, translation)
+
+            if best:
+                candidates.append(best)
+
+        return candidates
+
+    @staticmethod
+    def _resolve_overlaps(candidates: List[Tuple[int, int, str, str]]) -> List[Tuple[int, int, str, str]]:
+        """Greedy longest-match-wins: prefer earlier starts, then longer terms."""
+        candidates.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        matches = []
+        covered_until = 0
+        for start, end, term, translation in candidates:
+            if start >= covered_until:
+                matches.append((start, end, term, translation))
+                covered_until = end
+
+        return matches
+
+    def _preprocess_with_matches(self, text: str, matches: List[Tuple[int, int, str, str]]) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Substitute placeholders for matched spans in a single pass."""
+        parts = []
+        cursor = 0
+        replacements = {}
+        original_cases = {}
+
+        for counter, (start, end, term, translation) in enumerate(matches):
+            placeholder = f"<{counter}>"
+            parts.append(text[cursor:start])
+            parts.append(placeholder)
+            cursor = end
+
+            original = text[start:end]
+            replacements[placeholder] = translation
+            original_cases[placeholder] = {
+                'content': original,
+                'full': original,
+                'leading': '',
+                'tag': _detect_case_tag(original, original, '')
+            }
+
+        parts.append(text[cursor:])
+        return ''.join(parts), replacements, original_cases
+
     def _remove_stopwords(self, phrase: str) -> str:
         """Remove stopwords from a phrase."""
-        if not SPACY_AVAILABLE:
-            # Simple fallback
-            words = phrase.lower().split()
-            filtered_words = [w for w in words if w not in STOPWORDS]
-            return ' '.join(filtered_words)
-
-        doc = nlp(phrase.lower())
-        cleaned_tokens = [token.text for token in doc if not token.is_stop]
-        return ' '.join(cleaned_tokens).strip()
-
-    def _extract_noun_phrases(self, text: str) -> List[Dict]:
-        """Extract noun phrases from text using spaCy, filtering stopwords."""
-        if not SPACY_AVAILABLE:
-            # Fallback: extract words that are in our dictionary
-            words = re.findall(r'\b\w+\b', text.lower())
+        return _remove_stopwords_cached(phrase)
+
+    def _extract_noun_phrases(self, sentence) -> List[Dict]:
+        """Extract noun phrases from a sentence, filtering stopwords.
+
+        Accepts an already-parsed spaCy Span (a sentence from a shared Doc)
+        so the pipeline runs once per input text instead of once per
+        sentence. A plain string is also accepted for the no-spaCy fallback.
+        All positions are relative to the start of the sentence.
+        """
+        if isinstance(sentence, str):
+            text = sentence
+            # Fallback: extract words that are in our dictionary. Lowercase
+            # once and take positions straight from the scan instead of a
+            # .lower().find() per matching word - that also gives each
+            # occurrence its own offsets rather than the first one's.
+            text_lower = text.lower()
             result = []
-            for word in words:
+            for match in re.finditer(r'\b\w+\b', text_lower):
+                word = match.group()
                 if word in self.terms:
-                    # Find position in original text
-                    start = text.lower().find(word)
-                    if start != -1:
-                        result.append({
-                            'text': word,
-                            'chunk_start': start,
-                            'chunk_end': start + len(word),
-                            'start': start,
-                            'end': start + len(word),
-                            'leading_stopwords': '',
-                            'trailing_stopwords': ''
-                        })
+                    result.append({
+                        'text': word,
+                        'text_lower': word,
+                        'chunk_start': match.start(),
+                        'chunk_end': match.end(),
+                        'start': match.start(),
+                        'end': match.end(),
+                        'leading_stopwords': '',
+                        'trailing_stopwords': ''
+                    })
             return result
 
-        doc = nlp(text)
+        # Offset to make token/chunk positions sentence-relative
+        offset = sentence.start_char
         noun_phrases = []
 
         # Extract noun chunks and filter stopwords
-        for chunk in doc.noun_chunks:
+        for chunk in sentence.noun_chunks:
             # Get all tokens in this chunk
             tokens = [token for token in chunk]
 
@@ -183,11 +428,12 @@ class TerminologyManager:
 
             noun_phrases.append({
                 'text': content_text,  # Only content words, no stopwords
+                'text_lower': content_text.lower(),  # Precomputed for the matcher loop
                 'full_text': chunk.text,  # Original full phrase with stopwords
-                'chunk_start': chunk.start_char,  # Start of the entire chunk (including leading stopwords)
-                'chunk_end': chunk.end_char,  # End of the entire chunk (including trailing stopwords)
-                'start': first_content.idx,  # Start of first content word
-                'end': last_content.idx + len(last_content.text),  # End of last content word
+                'chunk_start': chunk.start_char - offset,  # Start of the entire chunk (including leading stopwords)
+                'chunk_end': chunk.end_char - offset,  # End of the entire chunk (including trailing stopwords)
+                'start': first_content.idx - offset,  # Start of first content word
+                'end': last_content.idx + len(last_content.text) - offset,  # End of last content word
                 'root': chunk.root.text,
                 'has_stopwords': len(tokens) != len(content_tokens),  # Flag if stopwords were removed
                 'leading_stopwords': ''.join(leading_stopwords),
@@ -210,11 +456,51 @@ class TerminologyManager:
             # No terms to substitute
             return text, {}, {}
 
-        # Split into sentences to process separately
-        if SPACY_AVAILABLE:
-            doc = nlp(text)
-            sentences = [sent.text for sent in doc.sents]
-            sentence_spans = [(sent.start_char, sent.end_char) for sent in doc.sents]
+        # Fast path: single linear scan (automaton or trie), no NLP needed.
+        # Lowercase exactly once per input - and not at all when the text
+        # already is lowercase, the common case for batch corpora - and
+        # reuse that copy for matching and the memoized-scan cache key.
+        if not self.use_noun_phrases:
+            text_lower = text if text.islower() else text.lower()
+            matches = self._find_term_matches(text_lower)
+            return self._preprocess_with_matches(text, matches)
+
+        nlp = _get_nlp()
+        doc = nlp(text) if nlp is not None else None
+        return self._preprocess_parsed(text, doc)
+
+    def preprocess_batch(self, texts: List[str], batch_size: int = 64,
+                         n_process: int = 1):
+        """
+        Preprocess multiple texts, batching the spaCy pipeline via nlp.pipe().
+
+        Args:
+            texts: List of input texts
+            batch_size: Batch size passed to nlp.pipe()
+            n_process: Worker processes for nlp.pipe(); use >1 to spread the
+                parse over multiple cores on large batches
+
+        Yields:
+            (preprocessed_text, replacements_dict, original_cases_dict) per text
+        """
+        if not self.terms or not self.use_noun_phrases or _get_nlp() is None:
+            # Nothing to batch: either no substitution will happen or the
+            # fast scan path doesn't go through spaCy at all
+            for text in texts:
+                yield self.preprocess_text(text)
+            return
+
+        docs = _get_nlp().pipe(texts, batch_size=batch_size, n_process=n_process)
+        for text, doc in zip(texts, docs):
+            yield self._preprocess_parsed(text, doc)
+
+    def _preprocess_parsed(self, text: str, doc) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Run placeholder substitution over an already-parsed Doc (or None)."""
+        # Split into sentences; the sentence Spans share the single Doc so
+        # noun chunks don't trigger a re-parse per sentence
+        if doc is not None:
+            sentences = list(doc.sents)
+            sentence_spans = [(sent.start_char, sent.end_char) for sent in sentences]
         else:
             # Simple sentence splitting
             sentences = re.split(r'(?<=[.!?])\s+', text)
@@ -226,74 +512,80 @@ class TerminologyManager:
         placeholder_counter = 0  # Shared counter across all sentences
 
         for sentence in sentences:
-            # Extract noun phrases from the sentence
+            # Extract noun phrases from the sentence (Span or plain string)
             noun_phrases = self._extract_noun_phrases(sentence)
+            sentence = sentence if isinstance(sentence, str) else sentence.text
 
-            # Find phrases that match our terminology (case-insensitive)
+            # Find phrases that match our terminology (case-insensitive).
+            # Matches are (phrase, term_key) pairs so the miss path doesn't
+            # need to allocate a dict copy per candidate.
             matching_phrases = []
             for phrase in noun_phrases:
-                phrase_lower = phrase['text'].lower()
-                
+                phrase_lower = phrase['text_lower']
+
                 # Try exact match with content words
                 if phrase_lower in self.terms:
-                    matching_phrases.append(phrase)
+                    matching_phrases.append((phrase, phrase_lower))
                 else:
                     # Try without any remaining stopwords (should already be clean, but double-check)
                     cleaned = self._remove_stopwords(phrase_lower)
                     if cleaned and cleaned in self.terms:
-                        # Update the phrase info with cleaned version
-                        phrase_copy = phrase.copy()
-                        phrase_copy['text'] = cleaned
-                        matching_phrases.append(phrase_copy)
+                        matching_phrases.append((phrase, cleaned))
 
-            # Sort by position (end to start) to avoid replacement issues
-            matching_phrases.sort(key=lambda x: x.get('chunk_start', x['start']), reverse=True)
+            # Sort by position (ascending) and rebuild the sentence in one
+            # cursor walk - repeated slice-and-concatenate would copy the
+            # whole sentence once per match
+            matching_phrases.sort(key=lambda x: x[0].get('chunk_start', x[0]['start']))
 
-            preprocessed_sentence = sentence
+            parts = []
+            cursor = 0
             sentence_replacements = {}
             sentence_original_cases = {}
 
-            for phrase in matching_phrases:
-                phrase_lower = phrase['text'].lower()
-                translation = self.terms.get(phrase_lower)
+            for phrase, term_key in matching_phrases:
+                translation = self.terms.get(term_key)
 
                 if translation:
+                    # Replace the ENTIRE chunk (from chunk_start to chunk_end)
+                    # with: leading_stopwords + placeholder + trailing_stopwords
+                    chunk_start_pos = phrase.get('chunk_start', phrase['start'])
+                    chunk_end_pos = phrase.get('chunk_end', phrase['end'])
+
+                    # Skip chunks overlapping an already-replaced span
+                    if chunk_start_pos < cursor:
+                        continue
+
                     placeholder = f"<{placeholder_counter}>"
                     placeholder_counter += 1
 
                     # Get leading and trailing stopwords
                     leading = phrase.get('leading_stopwords', '')
                     trailing = phrase.get('trailing_stopwords', '')
-                    
-                    # Replace the ENTIRE chunk (from chunk_start to chunk_end)
-                    # with: leading_stopwords + placeholder + trailing_stopwords
-                    chunk_start_pos = phrase.get('chunk_start', phrase['start'])
-                    chunk_end_pos = phrase.get('chunk_end', phrase['end'])
 
-                    # Build the replacement: leading stopwords + placeholder + trailing stopwords
-                    replacement = leading + placeholder + trailing
-
-                    # Replace the entire chunk
-                    preprocessed_sentence = (
-                        preprocessed_sentence[:chunk_start_pos] + 
-                        replacement + 
-                        preprocessed_sentence[chunk_end_pos:]
-                    )
+                    parts.append(sentence[cursor:chunk_start_pos])
+                    parts.append(leading + placeholder + trailing)
+                    cursor = chunk_end_pos
 
                     sentence_replacements[placeholder] = translation
                     # Store both the content words and the full phrase for case preservation
                     sentence_original_cases[placeholder] = {
                         'content': phrase['text'],  # Just "station"
                         'full': phrase.get('full_text', phrase['text']),  # "the station"
-                        'leading': leading  # "the "
+                        'leading': leading,  # "the "
+                        'tag': _detect_case_tag(
+                            phrase['text'],
+                            phrase.get('full_text', phrase['text']),
+                            leading
+                        )
                     }
 
-            processed_sentences.append(preprocessed_sentence)
+            parts.append(sentence[cursor:])
+            processed_sentences.append(''.join(parts))
             all_replacements.update(sentence_replacements)
             all_original_cases.update(sentence_original_cases)
 
         # Reconstruct text with processed sentences
-        if SPACY_AVAILABLE:
+        if doc is not None:
             # Join preserving original structure
             preprocessed_text = ''.join(
                 processed_sentences[i] + (text[sentence_spans[i][1]:sentence_spans[i+1][0]] if i < len(sentence_spans) - 1 else '')
@@ -321,97 +613,88 @@ class TerminologyManager:
         Returns:
             Postprocessed text with actual translations
         """
-        result = text
+        if not replacements:
+            return self._ensure_sentence_capitalization(text)
+
+        def _resolve(match):
+            placeholder = match.group(0)
+            translation = replacements.get(placeholder)
+            if translation is None:
+                # Not one of our placeholders - leave it untouched
+                return placeholder
 
-        for placeholder, translation in replacements.items():
             case_info = original_cases.get(placeholder, '')
-            
+
             # Handle both old format (string) and new format (dict)
             if isinstance(case_info, dict):
-                original_content = case_info.get('content', '')
-                original_full = case_info.get('full', '')
-                leading_stopword = case_info.get('leading', '')
+                case_tag = case_info.get('tag')
+                if case_tag is None:
+                    # Dict without a precomputed tag - classify it now
+                    case_tag = _detect_case_tag(
+                        case_info.get('content', ''),
+                        case_info.get('full', ''),
+                        case_info.get('leading', '')
+                    )
             else:
                 # Old format - just a string
-                original_content = case_info
-                original_full = case_info
-                leading_stopword = ''
-            
-            # Determine the case to apply based on the full phrase (including leading stopword)
-            original_to_check = original_full if original_full else original_content
-            
-            # Find the placeholder in the text to check if it's at sentence start
-            import re
-            placeholder_pattern = re.escape(placeholder)
-            match = re.search(placeholder_pattern, result)
-            
+                case_tag = _detect_case_tag(case_info, case_info, '')
+
+            # The match position gives sentence-start context directly -
+            # no extra search over the result needed
+            pos = match.start()
             is_sentence_start = False
-            if match:
-                pos = match.start()
-                if pos == 0:
+            if pos == 0:
+                is_sentence_start = True
+            elif pos >= 2:
+                # Check if preceded by sentence-ending punctuation + space
+                preceding = text[pos-2:pos]
+                if preceding in ('. ', '! ', '? '):
                     is_sentence_start = True
-                elif pos >= 2:
-                    # Check if preceded by sentence-ending punctuation + space
-                    preceding = result[max(0, pos-2):pos]
-                    if preceding in ['. ', '! ', '? ']:
-                        is_sentence_start = True
-            
-            # Apply case based on the original phrase
-            if original_to_check:
-                # Check if the leading stopword (if any) was capitalized
-                leading_was_capitalized = False
-                if leading_stopword.strip() and leading_stopword.strip()[0].isupper():
-                    leading_was_capitalized = True
-                
-                # Now apply appropriate casing
-                if original_to_check.isupper():
-                    # Original was ALL UPPERCASE (e.g., "THE HOUSE")
-                    translation = translation.upper()
-                elif original_content.istitle() or (len(original_content.split()) > 1 and all(word[0].isupper() for word in original_content.split() if word)):
-                    # Original content was Title Case (e.g., "Big House")
-                    translation = translation.title()
-                elif original_content[0].isupper() or leading_was_capitalized:
-                    # Original started with uppercase - either the content word itself or the leading stopword
-                    # Capitalize first letter of translation
-                    if len(translation) > 0:
-                        translation = translation[0].upper() + translation[1:].lower()
-                else:
-                    # Original was all lowercase
-                    translation = translation.lower()
+
+            # Apply the precomputed case tag - no re-examination of the
+            # original phrase here
+            if case_tag == _CASE_UPPER:
+                translation = translation.upper()
+            elif case_tag == _CASE_TITLE:
+                translation = translation.title()
+            elif case_tag == _CASE_SENTENCE:
+                if len(translation) > 0:
+                    translation = translation[0].upper() + translation[1:].lower()
             else:
-                # Default to lowercase if no case info
                 translation = translation.lower()
-            
+
             # If at sentence start, ensure first letter is capitalized (override previous logic)
             if is_sentence_start and len(translation) > 0:
                 translation = translation[0].upper() + translation[1:]
 
-            result = result.replace(placeholder, translation)
+            return translation
+
+        # Single pass over the text: every placeholder is resolved in place
+        # instead of one full-string replace per placeholder
+        result = _PLACEHOLDER_RE.sub(_resolve, text)
 
         # Final pass: ensure sentences start with capital letters
         result = self._ensure_sentence_capitalization(result)
-        
+
         return result
     
     def _ensure_sentence_capitalization(self, text: str) -> str:
         """Ensure that sentences start with capital letters."""
         if not text:
             return text
-        
-        # Capitalize first character
-        result = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
-        
-        # Capitalize after sentence-ending punctuation
-        import re
-        # Pattern: sentence-ending punctuation followed by space(s) and a lowercase letter
-        pattern = r'([.!?])\s+([a-z])'
-        
+
+        # Capitalize first character (only copy the string when needed)
+        result = text[0].upper() + text[1:] if text[0].islower() else text
+
+        # Capitalize after sentence-ending punctuation; in the common case
+        # nothing matches and the substitution pass is skipped entirely
+        if _SENT_CAP_RE.search(result) is None:
+            return result
+
         def capitalize_match(match):
             return match.group(1) + ' ' + match.group(2).upper()
-        
-        result = re.sub(pattern, capitalize_match, result)
-        
-        return result
+
+        return _SENT_CAP_RE.sub(capitalize_match, result)
 
     def get_terms_count(self) -> Dict[str, int]:
         """Get count of terms."""
@@ -0,0 +1,43 @@
+# nkrane_gt/throttle.py
+"""
+Client-side request pacing.
+
+Google starts returning 429s after bursts of unauthenticated requests;
+pacing ourselves at a steady rate avoids the retry storms and long
+backoffs that otherwise dominate batch wall-clock time.
+"""
+import threading
+import time
+
+class TokenBucket:
+    """Simple token bucket: acquire() sleeps until a token is available.
+
+    Tokens refill continuously at `rate` per second up to `capacity`
+    (default: one second's worth), so short bursts are allowed but the
+    sustained request rate never exceeds `rate`. Safe to share between
+    the worker threads of a concurrent batch: handing out tokens is
+    serialized, which is exactly the pacing we want.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """Take tokens from the bucket, sleeping until enough are available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return
+
+            shortfall = tokens - self._tokens
+            time.sleep(shortfall / self.rate)
+            self._tokens = 0.0
+            self._last = time.monotonic()
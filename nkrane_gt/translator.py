@@ -1,8 +1,13 @@
 # nkrane_gt/translator.py
+import functools
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from typing import Dict, Any, Optional
+from . import cache
+from .throttle import TokenBucket
 from .terminology_manager import TerminologyManager
 from .language_codes import convert_lang_code, is_google_supported
 
@@ -10,8 +15,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class NkraneTranslator:
-    def __init__(self, target_lang: str, src_lang: str = 'en', 
-                 terminology_source: str = None):
+    def __init__(self, target_lang: str, src_lang: str = 'en',
+                 terminology_source: str = None, use_cache: bool = True,
+                 rate_limit: float = 3.0):
         """
         Initialize Nkrane Translator.
 
@@ -19,9 +25,15 @@ class NkraneTranslator:
             target_lang: Target language code (e.g., 'ak', 'ee', 'gaa')
             src_lang: Source language code (default: 'en')
             terminology_source: Path to user's terminology CSV file (optional)
+            use_cache: If True, reuse Google responses from the persistent
+                on-disk cache and store new ones there
+            rate_limit: Max Google requests per second (0 or None disables
+                client-side pacing)
         """
         self.target_lang = target_lang
         self.src_lang = src_lang
+        self.use_cache = use_cache
+        self._bucket = TokenBucket(rate_limit) if rate_limit else None
 
         # Initialize terminology manager
         self.terminology_manager = TerminologyManager(
@@ -50,6 +62,20 @@ class NkraneTranslator:
         Synchronous Google Translate using requests.
         Uses the same endpoint that googletrans library uses.
         """
+        # Check the persistent cache first - a hit skips the network
+        # round-trip (the dominant cost) entirely
+        cache_key = None
+        if self.use_cache:
+            cache_key = cache.make_key(self.src_lang_google, self.target_lang_google, text)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Cache hit for translation request")
+                return cached
+
+        # Pace actual network calls (cache hits never consume a token)
+        if self._bucket is not None:
+            self._bucket.acquire()
+
         # Google Translate web API endpoint (same one googletrans uses)
         url = "https://translate.googleapis.com/translate_a/single"
 
@@ -80,7 +106,12 @@ class NkraneTranslator:
                     if item and len(item) > 0:
                         translated_parts.append(item[0])
 
-            return ''.join(translated_parts)
+            translated = ''.join(translated_parts)
+
+            if cache_key is not None:
+                cache.set(cache_key, translated)
+
+            return translated
 
         except requests.exceptions.Timeout:
             raise TimeoutError("Google Translate request timed out after 30 seconds")
@@ -89,13 +120,18 @@ class NkraneTranslator:
         except (IndexError, TypeError) as e:
             raise Exception(f"Failed to parse Google Translate response: {e}")
 
-    def translate(self, text: str, debug: bool = False, **kwargs) -> Dict[str, Any]:
+    def translate(self, text: str, debug: bool = False, verbose: bool = False,
+                  _preprocessed=None, **kwargs) -> Dict[str, Any]:
         """
         Translate text with terminology control.
 
         Args:
             text: Text to translate
             debug: If True, print detailed debug information
+            verbose: If True, include the intermediate fields (preprocessed
+                text, raw Google output, replaced terms, Google codes) in
+                the result instead of just the translation itself
+            _preprocessed: Precomputed preprocessing triple (used by batch_translate)
             **kwargs: Additional arguments (kept for API compatibility)
 
         Returns:
@@ -105,7 +141,10 @@ class NkraneTranslator:
 
         try:
             # Step 1: Preprocess - replace noun phrases with placeholders
-            preprocessed_text, replacements, original_cases = self.terminology_manager.preprocess_text(text)
+            if _preprocessed is not None:
+                preprocessed_text, replacements, original_cases = _preprocessed
+            else:
+                preprocessed_text, replacements, original_cases = self.terminology_manager.preprocess_text(text)
 
             if debug:
                 print("\n" + "="*60)
@@ -145,47 +184,170 @@ class NkraneTranslator:
                 print(f"\n⏱️  Translation time: {end_time - start_time:.2f}s")
                 print("="*60 + "\n")
 
-            return {
+            result = {
                 'text': final_text,
                 'src': self.src_lang,
                 'dest': self.target_lang,
                 'original': text,
-                'preprocessed': preprocessed_text,
-                'google_translation': translated_with_placeholders,
                 'replacements_count': len(replacements),
-                'src_google': self.src_lang_google,
-                'dest_google': self.target_lang_google,
-                'replaced_terms': list(replacements.keys()),
                 'translation_time': end_time - start_time
             }
 
+            # Only materialize the intermediate fields when asked for -
+            # the common path just wants the translation
+            if verbose or debug:
+                result.update({
+                    'preprocessed': preprocessed_text,
+                    'google_translation': translated_with_placeholders,
+                    'src_google': self.src_lang_google,
+                    'dest_google': self.target_lang_google,
+                    'replaced_terms': list(replacements.keys())
+                })
+
+            return result
+
         except Exception as e:
             logger.error(f"❌ Translation failed: {e}")
             raise
 
-    def batch_translate(self, texts: list, debug: bool = False, **kwargs) -> list:
-        """Translate multiple texts."""
-        results = []
-        for i, text in enumerate(texts):
+    def batch_translate(self, texts: list, debug: bool = False,
+                        n_process: int = 1, concurrency: int = 4, **kwargs) -> list:
+        """Translate multiple texts, batching the spaCy preprocessing.
+
+        Args:
+            texts: Texts to translate
+            debug: If True, print detailed debug information
+            n_process: Worker processes for the spaCy preprocessing; >1
+                spreads the parse over multiple cores on large batches
+            concurrency: Worker threads for per-line Google requests when
+                the single batched request can't be used (1 = sequential);
+                the token bucket still bounds the overall request rate
+        """
+        # Localization-style inputs repeat lines heavily ("OK", headers,
+        # product names); translate the unique set once and scatter the
+        # results back by line - every duplicate saved is a Google call
+        # (or cache lookup) avoided
+        if len(texts) > 1:
+            unique = list(dict.fromkeys(texts))
+            if len(unique) < len(texts):
+                unique_results = self.batch_translate(
+                    unique, debug=debug, n_process=n_process,
+                    concurrency=concurrency, **kwargs
+                )
+                mapping = dict(zip(unique, unique_results))
+                return [dict(mapping[text]) for text in texts]
+
+        preprocessed = list(self.terminology_manager.preprocess_batch(texts, n_process=n_process))
+
+        # Fast path: send all lines as one newline-joined request instead of
+        # N round-trips - one HTTP call for the whole file, which is also
+        # far friendlier to Google's rate limiting. Falls back to per-line
+        # requests if Google doesn't hand the segments back intact.
+        if not debug and len(texts) > 1 and not any('\n' in t for t in texts):
+            batch_result = self._batch_translate_joined(
+                texts, preprocessed, verbose=kwargs.get('verbose', False)
+            )
+            if batch_result is not None:
+                return batch_result
+
+        def _translate_one(item):
+            i, text, pre = item
             try:
                 if debug:
                     print(f"\n{'='*60}")
                     print(f"Translating text {i+1}/{len(texts)}")
                     print(f"{'='*60}")
-                
-                result = self.translate(text, debug=debug, **kwargs)
-                results.append(result)
 
-                # Add a small delay to avoid rate limiting
-                if i < len(texts) - 1:
-                    time.sleep(0.5)
+                return self.translate(text, debug=debug, _preprocessed=pre, **kwargs)
 
             except Exception as e:
                 logger.error(f"❌ Failed to translate text {i}: {e}")
-                results.append({
+                return {
                     'text': '',
                     'error': str(e),
                     'original': text
+                }
+
+        items = [(i, text, pre) for i, (text, pre) in enumerate(zip(texts, preprocessed))]
+
+        # Requests are network-bound with high per-call RTT, so overlapping
+        # a few of them cuts wall-clock time; the shared token bucket keeps
+        # the aggregate rate within the limit. Debug output stays readable
+        # by keeping that mode sequential.
+        if not debug and concurrency > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                return list(pool.map(_translate_one, items))
+
+        return [_translate_one(item) for item in items]
+
+    def _batch_translate_joined(self, texts: list, preprocessed: list,
+                                verbose: bool = False) -> Optional[list]:
+        """Translate all texts in a single newline-joined request.
+
+        Returns the per-text result list, or None when the batched call
+        fails or Google doesn't return one segment per input line (the
+        caller then falls back to per-line requests).
+        """
+        start_time = time.time()
+
+        try:
+            joined = '\n'.join(pre[0] for pre in preprocessed)
+            translated = self._google_translate_sync(joined)
+        except Exception as e:
+            logger.warning(f"⚠️  Batched translation failed ({e}); falling back to per-line requests")
+            return None
+
+        segments = translated.split('\n')
+        if len(segments) != len(texts):
+            logger.warning(
+                f"⚠️  Batched translation returned {len(segments)} segments "
+                f"for {len(texts)} inputs; falling back to per-line requests"
+            )
+            return None
+
+        elapsed = time.time() - start_time
+        results = []
+        for text, (preprocessed_text, replacements, original_cases), segment in zip(texts, preprocessed, segments):
+            final_text = self.terminology_manager.postprocess_text(
+                segment.strip(),
+                replacements,
+                original_cases
+            )
+            result = {
+                'text': final_text,
+                'src': self.src_lang,
+                'dest': self.target_lang,
+                'original': text,
+                'replacements_count': len(replacements),
+                'translation_time': elapsed / len(texts)
+            }
+            if verbose:
+                result.update({
+                    'preprocessed': preprocessed_text,
+                    'google_translation': segment.strip(),
+                    'src_google': self.src_lang_google,
+                    'dest_google': self.target_lang_google,
+                    'replaced_terms': list(replacements.keys())
                 })
+            results.append(result)
 
         return results
+
+@functools.lru_cache(maxsize=32)
+def get_translator(target_lang: str, src_lang: str = 'en',
+                   terminology_source: str = None, use_cache: bool = True,
+                   rate_limit: float = 3.0) -> NkraneTranslator:
+    """Return a shared NkraneTranslator for the given configuration.
+
+    Construction parses the terminology CSV and builds the matching
+    structures, which is wasteful to repeat when a session translates
+    with the same configuration many times. Instances are treated as
+    immutable after init, so sharing one per configuration is safe.
+    """
+    return NkraneTranslator(
+        target_lang=target_lang,
+        src_lang=src_lang,
+        terminology_source=terminology_source,
+        use_cache=use_cache,
+        rate_limit=rate_limit
+    )
@@ -1,9 +1,28 @@
 # nkrane_gt/utils.py
 import json
-import pandas as pd
+import os
+import pickle
 from typing import Dict, List
 from .terminology_manager import TerminologyManager
 
+# orjson serializes in C and is noticeably faster on large terminology
+# exports; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj) -> str:
+    """Serialize to indented JSON via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+_OPTIONS_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'nkrane-gt', 'options.pkl')
+
+# pandas is only needed by the sample-terminology helpers and is imported
+# there, so plain imports of the package don't pay its startup cost
+
 def list_available_options(terminology_source: str = None) -> Dict:
     """
     List available terms from terminology CSV.
@@ -19,15 +38,42 @@ def list_available_options(terminology_source: str = None) -> Dict:
             'term_count': 0,
             'message': 'No terminology source provided'
         }
-    
+
+    # Fingerprint the CSV by path/mtime/size; while it is unchanged the
+    # pickled result is returned without re-parsing the file at all
+    try:
+        stat = os.stat(terminology_source)
+        fingerprint = (os.path.abspath(terminology_source), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        fingerprint = None
+
+    if fingerprint is not None:
+        try:
+            with open(_OPTIONS_CACHE, 'rb') as f:
+                stored_fingerprint, stored_result = pickle.load(f)
+            if stored_fingerprint == fingerprint:
+                return stored_result
+        except Exception:
+            pass  # missing or stale cache - rebuild below
+
     manager = TerminologyManager(target_lang='en', user_csv_path=terminology_source)
     terms = manager.terms
-    
-    return {
+
+    result = {
         'term_count': len(terms),
         'terms': list(terms.keys())
     }
 
+    if fingerprint is not None:
+        try:
+            os.makedirs(os.path.dirname(_OPTIONS_CACHE), exist_ok=True)
+            with open(_OPTIONS_CACHE, 'wb') as f:
+                pickle.dump((fingerprint, result), f)
+        except Exception:
+            pass  # caching is best-effort
+
+    return result
+
 def export_terminology(terminology_source: str, 
                       output_format: str = 'json') -> str:
     """
@@ -53,7 +99,7 @@ def export_terminology(terminology_source: str,
     ]
     
     if output_format == 'json':
-        return json.dumps(terms_list, indent=2, ensure_ascii=False)
+        return _dumps(terms_list)
     elif output_format == 'csv':
         import io
         import csv
@@ -67,13 +113,15 @@ def export_terminology(terminology_source: str,
     else:  # 'dict'
         return terms_list
 
-def create_sample_terminology() -> pd.DataFrame:
+def create_sample_terminology() -> "pd.DataFrame":
     """
     Create a sample terminology DataFrame for testing.
-    
+
     Returns:
         Sample terminology as DataFrame
     """
+    import pandas as pd
+
     data = {
         'term': ['house', 'car', 'school', 'water', 'market'],
         'translation': ['efie', 'kaa', 'sukuu', 'nsu', 'dwabea']
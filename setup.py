@@ -1,9 +1,32 @@
-from setuptools import setup, find_packages
+from setuptools import setup
+from setuptools.command.build_py import build_py
 from setuptools.command.install import install
+import csv
+import glob
+import pickle
 import subprocess
 import sys
 import os
 
+class BuildPyCommand(build_py):
+    """Precompile packaged terminology CSVs into pickles at build time.
+
+    Loading a pickle at runtime takes microseconds where parsing the CSV
+    costs tens of milliseconds, so the first run after install doesn't pay
+    the parse. The CSVs are still shipped alongside for compatibility.
+    """
+    def run(self):
+        build_py.run(self)
+        for csv_path in glob.glob(os.path.join(self.build_lib, 'nkrane_gt', '*.csv')):
+            terms = {}
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                rows = list(csv.reader(f))
+            for row in rows[1:]:  # skip header
+                if len(row) >= 2 and row[0].strip() and row[1].strip():
+                    terms[row[0].strip().lower()] = row[1].strip()
+            with open(csv_path + '.pkl', 'wb') as f:
+                pickle.dump(terms, f)
+
 class PostInstallCommand(install):
     """Post-installation for installation mode."""
     def run(self):
@@ -40,7 +63,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/nkrane-gt",
-    packages=find_packages(),
+    packages=["nkrane_gt"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -55,7 +78,11 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=read_requirements(),
+    package_data={
+        'nkrane_gt': ['*.csv', '*.pkl'],
+    },
     cmdclass={
+        'build_py': BuildPyCommand,
         'install': PostInstallCommand,
     },
     entry_points={